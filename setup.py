@@ -0,0 +1,41 @@
+"""
+Build script for optional compiled extensions.
+
+Project metadata lives in pyproject.toml. This file only adds a Cython
+build of the data models when Cython is available in the build
+environment, e.g.:
+
+    pip install cython
+    pip install --no-build-isolation .
+
+Set SKIP_CYTHON=1 to force a pure-Python build. If compilation fails
+(no C compiler, unsupported platform) the pure-Python module is used.
+"""
+
+import os
+import sys
+
+from setuptools import Extension, setup
+
+ext_modules = []
+
+if not any(arg in sys.argv for arg in ("clean", "check")) and "SKIP_CYTHON" not in os.environ:
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        ext_modules = cythonize(
+            [
+                Extension(
+                    "mmdvm_statemachine.models",
+                    ["src/mmdvm_statemachine/models.py"],
+                    optional=True,
+                )
+            ],
+            # Keep Python typing semantics: annotations must not become C
+            # type checks (str-Enum members are passed where str is annotated)
+            compiler_directives={"language_level": 3, "annotation_typing": False},
+        )
+
+setup(ext_modules=ext_modules)
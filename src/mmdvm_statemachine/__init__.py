@@ -14,6 +14,7 @@ __license__ = "MIT"
 
 from mmdvm_state_machine.models import (
     Mode,
+    ModeValue,
     QSOStatus,
     QSO,
     SystemState,
@@ -22,6 +23,7 @@ from mmdvm_state_machine.models import (
 
 __all__ = [
     "Mode",
+    "ModeValue",
     "QSOStatus",
     "QSO",
     "SystemState",
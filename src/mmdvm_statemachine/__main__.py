@@ -16,18 +16,30 @@ It orchestrates the startup of all components in the correct order:
 import argparse
 import asyncio
 import logging
+import os
 import signal
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import Dict, Optional
 
 from mmdvm_state_machine import __version__
 from mmdvm_state_machine.config import load_config, Config
-from mmdvm_state_machine.logging_setup import setup_logging, get_logger
+from mmdvm_state_machine.logging_setup import setup_logging, get_logger, stop_logging
 
 # Logger will be initialized after config is loaded
 logger: Optional[logging.Logger] = None
 
+# uvloop is optional (the 'performance' extra); probe for it once at import
+_UVLOOP: Optional[ModuleType]
+try:
+    import uvloop
+
+    _UVLOOP = uvloop
+except ImportError:
+    _UVLOOP = None
+
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -74,26 +86,78 @@ Environment Variables:
     return parser.parse_args()
 
 
-def setup_signal_handlers(shutdown_event: asyncio.Event) -> None:
+def _read_cpu_idle_times() -> Dict[int, int]:
+    """
+    Read per-CPU idle time from /proc/stat.
+
+    Returns:
+        Mapping of CPU number to idle + iowait jiffies (empty if unavailable)
+    """
+    idle_times: Dict[int, int] = {}
+    try:
+        with open("/proc/stat") as f:
+            for line in f:
+                if line.startswith("cpu") and line[3].isdigit():
+                    fields = line.split()
+                    idle_times[int(fields[0][3:])] = int(fields[4]) + int(fields[5])
+    except (OSError, ValueError, IndexError):
+        pass
+    return idle_times
+
+
+def tune_process_scheduling() -> None:
+    """
+    Pin the process to its least busy CPU and raise its priority.
+
+    Log tailing and WebSocket fan-out run on a single event loop thread, so
+    keeping it on one core avoids cache-cold wake-ups after migrations. The
+    least busy CPU is picked from /proc/stat idle deltas over 100ms, among
+    the CPUs the process is allowed to use. Only the calling thread (and
+    threads it starts later) are pinned. Linux only; a no-op elsewhere.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+
+    allowed = os.sched_getaffinity(0)
+    if len(allowed) > 1:
+        before = _read_cpu_idle_times()
+        time.sleep(0.1)
+        after = _read_cpu_idle_times()
+        if before and after:
+            cpu = max(allowed, key=lambda c: after.get(c, 0) - before.get(c, 0))
+            os.sched_setaffinity(0, {cpu})
+            if logger:
+                logger.info("Pinned to CPU %d", cpu)
+
+    try:
+        os.nice(-5)
+    except PermissionError:
+        if logger:
+            logger.debug("No CAP_SYS_NICE, keeping default scheduling priority")
+
+
+def setup_signal_handlers(
+    shutdown_event: asyncio.Event, loop: asyncio.AbstractEventLoop
+) -> None:
     """
     Set up signal handlers for graceful shutdown.
 
-    Handles SIGINT (Ctrl+C) and SIGTERM (systemd stop) signals.
+    Handles SIGINT (Ctrl+C) and SIGTERM (systemd stop) signals. Handlers are
+    registered on the event loop, so they run as ordinary loop callbacks.
 
     Args:
         shutdown_event: Event to set on shutdown signal
+        loop: Running event loop
     """
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, _handle_shutdown_signal, sig, shutdown_event)
 
-    def signal_handler(sig, frame):
-        """Handle shutdown signal."""
-        signal_name = signal.Signals(sig).name
-        if logger:
-            logger.info(f"Received {signal_name}, initiating graceful shutdown...")
-        shutdown_event.set()
 
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+def _handle_shutdown_signal(sig: signal.Signals, shutdown_event: asyncio.Event) -> None:
+    """Handle shutdown signal."""
+    if logger:
+        logger.info("Received %s, initiating graceful shutdown...", sig.name)
+    shutdown_event.set()
 
 
 async def run_application(config: Config) -> int:
@@ -115,11 +179,16 @@ async def run_application(config: Config) -> int:
     global logger
     logger = get_logger(__name__)
 
+    # Run new tasks eagerly, so tasks that finish without blocking never
+    # need a trip through the event loop (Python 3.12+)
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     shutdown_event = asyncio.Event()
-    setup_signal_handlers(shutdown_event)
+    setup_signal_handlers(shutdown_event, asyncio.get_running_loop())
 
-    logger.info(f"Starting MMDVMHost State Machine v{__version__}")
-    logger.info(f"Configuration loaded from: {config}")
+    logger.info("Starting MMDVMHost State Machine v%s", __version__)
+    logger.info("Configuration loaded from: %s", config)
 
     try:
         # TODO: Initialize components in Phase 2+
@@ -153,7 +222,7 @@ async def run_application(config: Config) -> int:
         return 0
 
     except Exception as e:
-        logger.error(f"Fatal error during application runtime: {e}", exc_info=True)
+        logger.error("Fatal error during application runtime: %s", e, exc_info=True)
         return 1
 
 
@@ -189,27 +258,42 @@ def main() -> int:
         # Run application
         try:
             # Use uvloop if available and enabled (Linux only)
+            loop_factory = None
             if config.performance.use_uvloop:
-                try:
-                    import uvloop
-                    uvloop.install()
+                if _UVLOOP is not None:
+                    loop_factory = _UVLOOP.new_event_loop
                     logger.info("Using uvloop for enhanced async performance")
-                except ImportError:
+                else:
                     logger.warning(
                         "uvloop not available, using default asyncio event loop"
                     )
 
+            if config.performance.pin_cpu and config.performance.workers == 1:
+                tune_process_scheduling()
+
             # Run the async application
-            exit_code = asyncio.run(run_application(config))
+            if sys.version_info >= (3, 11):
+                # Runner builds the loop from the factory directly, without
+                # replacing the global event loop policy
+                with asyncio.Runner(loop_factory=loop_factory) as runner:
+                    exit_code = runner.run(run_application(config))
+            else:
+                if _UVLOOP is not None and loop_factory is not None:
+                    _UVLOOP.install()
+                exit_code = asyncio.run(run_application(config))
             return exit_code
 
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
             return 0
 
+        finally:
+            # Flush queued log records before exit
+            stop_logging()
+
     except Exception as e:
         if logger:
-            logger.critical(f"Unhandled exception: {e}", exc_info=True)
+            logger.critical("Unhandled exception: %s", e, exc_info=True)
         else:
             print(f"CRITICAL: Unhandled exception: {e}", file=sys.stderr)
         return 1
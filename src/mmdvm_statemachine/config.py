@@ -5,22 +5,44 @@ This module handles loading and validation of configuration from YAML files,
 with support for environment variable overrides and sensible defaults.
 
 Configuration is loaded using Pydantic settings for type safety and validation.
+Only the top-level Config is a settings class; the sections are plain Pydantic
+models, so the environment is read once per Config rather than once per
+section. MMDVM_* environment overrides reach the sections through Config
+(e.g. MMDVM_API__PORT).
 """
 
+import fnmatch
+import hashlib
+import json
 import os
+import re
+import stat
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, FrozenSet, List, Dict, Optional, Pattern, Tuple
 
 import yaml
-from pydantic import Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    # libyaml-backed loader, much faster than the pure-Python parser
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader  # type: ignore[assignment]
 
-class LogMonitoringConfig(BaseSettings):
+# Default application log format (see logging_setup.FastFormatter)
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class LogMonitoringConfig(BaseModel):
     """
     Configuration for log file monitoring.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     log_path_pattern: str = Field(
         "/var/log/mmdvm/MMDVM-*.log",
         description="Glob pattern for MMDVM log files",
@@ -42,20 +64,46 @@ class LogMonitoringConfig(BaseSettings):
             raise ValueError(f"log_directory must be an absolute path, got: {v}")
         return v
 
+    @cached_property
+    def compiled_pattern(self) -> Pattern[str]:
+        """Regex equivalent of log_path_pattern, compiled once."""
+        return re.compile(fnmatch.translate(self.log_path_pattern))
+
+    @cached_property
+    def pattern_parts(self) -> Tuple[Path, str]:
+        """
+        Split log_path_pattern into its literal directory and wildcard tail.
 
-class StateMachineConfig(BaseSettings):
+        For "/var/log/mmdvm/MMDVM-*.log" this is
+        (Path("/var/log/mmdvm"), "MMDVM-*.log"), so a directory scan can start
+        at the deepest directory that contains no wildcards.
+        """
+        parts = Path(self.log_path_pattern).parts
+        for i, part in enumerate(parts):
+            if any(c in part for c in "*?["):
+                break
+        else:
+            i = len(parts) - 1
+        return Path(*parts[:i]), "/".join(parts[i:])
+
+
+class StateMachineConfig(BaseModel):
     """
     Configuration for the state machine.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     qso_history_size: int = Field(
         100, description="Number of QSOs to retain in history"
     )
     qso_timeout_seconds: int = Field(
         30, description="QSO timeout (no activity)"
     )
-    supported_modes: List[str] = Field(
-        default_factory=lambda: ["DSTAR", "DMR", "YSF", "P25", "NXDN", "POCSAG", "FM", "IDLE"],
+    supported_modes: FrozenSet[str] = Field(
+        default_factory=lambda: frozenset(
+            ["DSTAR", "DMR", "YSF", "P25", "NXDN", "POCSAG", "FM", "IDLE"]
+        ),
         description="Supported operating modes",
     )
 
@@ -75,21 +123,31 @@ class StateMachineConfig(BaseSettings):
             raise ValueError("qso_timeout_seconds must be between 1 and 3600")
         return v
 
+    @field_validator("supported_modes", mode="after")
+    @classmethod
+    def normalize_supported_modes(cls, v: FrozenSet[str]) -> FrozenSet[str]:
+        """Upper-case and intern mode names for fast membership checks."""
+        return frozenset(sys.intern(mode.upper()) for mode in v)
+
 
-class RateLimitConfig(BaseSettings):
+class RateLimitConfig(BaseModel):
     """
     Rate limiting configuration.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     enabled: bool = Field(False, description="Enable rate limiting")
     requests_per_minute: int = Field(60, description="Maximum requests per minute")
 
 
-class APIConfig(BaseSettings):
+class APIConfig(BaseModel):
     """
     Configuration for REST API server.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     host: str = Field("0.0.0.0", description="API server host")
     port: int = Field(8080, description="API server port")
     enable_cors: bool = Field(True, description="Enable CORS")
@@ -118,11 +176,13 @@ class APIConfig(BaseSettings):
         return v
 
 
-class WebSocketConfig(BaseSettings):
+class WebSocketConfig(BaseModel):
     """
     Configuration for WebSocket server.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     max_connections: int = Field(50, description="Maximum concurrent connections")
     ping_interval: int = Field(30, description="Ping interval (seconds)")
     timeout: int = Field(300, description="Connection timeout (seconds)")
@@ -136,32 +196,36 @@ class WebSocketConfig(BaseSettings):
         return v
 
 
-class LogRotationConfig(BaseSettings):
+class LogRotationConfig(BaseModel):
     """
     Application log rotation configuration.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     enabled: bool = Field(True, description="Enable log rotation")
     max_bytes: int = Field(10485760, description="Max log file size (bytes)")
     backup_count: int = Field(5, description="Number of backup files to keep")
 
 
-class LoggingConfig(BaseSettings):
+class LoggingConfig(BaseModel):
     """
     Configuration for application logging.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     level: str = Field("INFO", description="Log level")
     file: Optional[str] = Field(
         "/var/log/mmdvm-state-machine/app.log", description="Log file path"
     )
-    format: str = Field(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        description="Log format string",
-    )
+    format: str = Field(DEFAULT_LOG_FORMAT, description="Log format string")
     rotation: LogRotationConfig = Field(
         default_factory=LogRotationConfig, description="Log rotation config"
     )
+    batch_writes: bool = Field(
+        True, description="Write queued log records in batches rather than one at a time"
+    )
 
     @field_validator("level")
     @classmethod
@@ -174,14 +238,23 @@ class LoggingConfig(BaseSettings):
         return v_upper
 
 
-class PerformanceConfig(BaseSettings):
+class PerformanceConfig(BaseModel):
     """
     Performance tuning configuration.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     use_uvloop: bool = Field(True, description="Use uvloop for async (Linux only)")
     workers: int = Field(1, description="Number of worker processes")
     enable_metrics: bool = Field(False, description="Enable Prometheus metrics")
+    yaml_cache: bool = Field(
+        False, description="Cache parsed YAML config as JSON next to the config file"
+    )
+    pin_cpu: bool = Field(
+        False,
+        description="Pin to the least busy CPU and raise priority when workers is 1 (Linux only)",
+    )
 
     @field_validator("workers")
     @classmethod
@@ -224,6 +297,12 @@ class Config(BaseSettings):
         This method reads the YAML file, parses it, and constructs a validated
         Config object. Environment variables can still override YAML values.
 
+        If performance.yaml_cache is enabled, the parsed YAML is also written to
+        a "<config>.yaml.cache.json" sidecar keyed by the YAML file's mtime,
+        size, inode and ctime, so later starts can skip the YAML parser
+        entirely. The sidecar gets the
+        YAML file's permission bits and is removed when the cache is disabled.
+
         Args:
             yaml_path: Path to YAML configuration file
 
@@ -239,21 +318,55 @@ class Config(BaseSettings):
         if not yaml_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {yaml_path}")
 
-        with yaml_file.open("r") as f:
-            config_dict = yaml.safe_load(f)
+        cache_file = yaml_file.with_name(yaml_file.name + ".cache.json")
+        yaml_stat = yaml_file.stat()
+        source = _yaml_cache_key(yaml_stat)
 
+        config_dict = _read_yaml_cache(cache_file, source)
+        cache_hit = config_dict is not None
         if config_dict is None:
-            config_dict = {}
-
-        # Create nested config objects
-        return cls(
-            log_monitoring=LogMonitoringConfig(**config_dict.get("log_monitoring", {})),
-            state_machine=StateMachineConfig(**config_dict.get("state_machine", {})),
-            api=APIConfig(**config_dict.get("api", {})),
-            websocket=WebSocketConfig(**config_dict.get("websocket", {})),
-            logging=LoggingConfig(**config_dict.get("logging", {})),
-            performance=PerformanceConfig(**config_dict.get("performance", {})),
-        )
+            config_dict = _parse_yaml(yaml_file.read_text())
+
+        # Decide from the validated setting (so env overrides and "false"
+        # strings are honoured), and only cache configs that validated
+        config = cls._from_dict(config_dict)
+        if not config.performance.yaml_cache:
+            _remove_yaml_cache(cache_file)
+        elif not cache_hit:
+            _write_yaml_cache(
+                cache_file, source, config_dict, stat.S_IMODE(yaml_stat.st_mode)
+            )
+        return config
+
+    @classmethod
+    def from_yaml_str(cls, yaml_text: str) -> "Config":
+        """
+        Load configuration from a YAML document held in memory.
+
+        Environment variables can still override YAML values.
+
+        Args:
+            yaml_text: YAML configuration document
+
+        Returns:
+            Validated Config object
+
+        Raises:
+            yaml.YAMLError: If YAML is malformed
+            ValueError: If configuration validation fails
+        """
+        return cls._from_dict(_parse_yaml(yaml_text))
+
+    @classmethod
+    def _from_dict(cls, config_dict: Dict[str, Any]) -> "Config":
+        # Pass sections as plain dicts so each is validated once, as part of
+        # the outer Config (unknown top-level keys are ignored)
+        sections: Dict[str, Any] = {
+            name: config_dict[name] or {}
+            for name in cls.model_fields
+            if name in config_dict
+        }
+        return cls(**sections)
 
     @classmethod
     def get_default_config_path(cls) -> Path:
@@ -266,33 +379,16 @@ class Config(BaseSettings):
         3. ~/.config/mmdvm-state-machine/config.yaml
         4. /etc/mmdvm-state-machine/config.yaml
 
+        The result is cached for the life of the process (per MMDVM_CONFIG
+        value), so repeated reloads do not re-probe the filesystem.
+
         Returns:
             Path to configuration file
 
         Raises:
             FileNotFoundError: If no configuration file found
         """
-        # Check environment variable
-        env_path = os.environ.get("MMDVM_CONFIG")
-        if env_path:
-            path = Path(env_path)
-            if path.exists():
-                return path
-
-        # Check standard locations
-        search_paths = [
-            Path("config.yaml"),
-            Path.home() / ".config" / "mmdvm-state-machine" / "config.yaml",
-            Path("/etc/mmdvm-state-machine/config.yaml"),
-        ]
-
-        for path in search_paths:
-            if path.exists():
-                return path
-
-        raise FileNotFoundError(
-            "No configuration file found. Please create config.yaml or set MMDVM_CONFIG"
-        )
+        return _resolve_default_config_path(os.environ.get("MMDVM_CONFIG"))
 
     def validate_runtime(self) -> None:
         """
@@ -304,13 +400,19 @@ class Config(BaseSettings):
         Raises:
             ValueError: If runtime validation fails
         """
-        # Check log directory exists and is readable
-        log_dir = Path(self.log_monitoring.log_directory)
-        if not log_dir.exists():
+        # Check log directory exists (stat) and is readable (access, which
+        # also accounts for ACLs and read-only mounts)
+        try:
+            os.stat(self.log_monitoring.log_directory)
+        except (FileNotFoundError, NotADirectoryError):
             raise ValueError(
                 f"Log directory does not exist: {self.log_monitoring.log_directory}"
-            )
-        if not os.access(log_dir, os.R_OK):
+            ) from None
+        except OSError as e:
+            raise ValueError(
+                f"Cannot access log directory {self.log_monitoring.log_directory}: {e}"
+            ) from e
+        if not os.access(self.log_monitoring.log_directory, os.R_OK):
             raise ValueError(
                 f"Log directory is not readable: {self.log_monitoring.log_directory}"
             )
@@ -318,24 +420,250 @@ class Config(BaseSettings):
         # Check application log directory is writable (if specified)
         if self.logging.file:
             app_log_dir = Path(self.logging.file).parent
-            if not app_log_dir.exists():
+            try:
+                os.stat(app_log_dir)
+            except (FileNotFoundError, NotADirectoryError):
                 try:
-                    app_log_dir.mkdir(parents=True, exist_ok=True)
+                    os.makedirs(app_log_dir, exist_ok=True)
                 except OSError as e:
                     raise ValueError(
                         f"Cannot create log directory {app_log_dir}: {e}"
                     )
+            except OSError as e:
+                raise ValueError(
+                    f"Cannot access log directory {app_log_dir}: {e}"
+                ) from e
             if not os.access(app_log_dir, os.W_OK):
                 raise ValueError(
                     f"Log directory is not writable: {app_log_dir}"
                 )
 
 
+@lru_cache(maxsize=None)
+def _resolve_default_config_path(env_path: Optional[str]) -> Path:
+    """
+    Find the first existing configuration file.
+
+    Args:
+        env_path: Value of MMDVM_CONFIG, if set
+
+    Returns:
+        Path to configuration file
+
+    Raises:
+        FileNotFoundError: If no configuration file found
+    """
+    search_paths = [
+        Path("config.yaml"),
+        Path.home() / ".config" / "mmdvm-state-machine" / "config.yaml",
+        Path("/etc/mmdvm-state-machine/config.yaml"),
+    ]
+    if env_path:
+        search_paths.insert(0, Path(env_path))
+
+    for path in search_paths:
+        try:
+            os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        return path
+
+    raise FileNotFoundError(
+        "No configuration file found. Please create config.yaml or set MMDVM_CONFIG"
+    )
+
+
+def _parse_yaml(yaml_text: str) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration document.
+
+    Args:
+        yaml_text: YAML document
+
+    Returns:
+        Parsed mapping ({} for an empty document)
+    """
+    return yaml.load(yaml_text, Loader=YAMLSafeLoader) or {}
+
+
+def _yaml_cache_key(st: os.stat_result) -> List[int]:
+    """
+    Identify a version of the YAML file for the JSON sidecar.
+
+    mtime alone is not enough: touch -r, cp -p, rsync and tar all restore
+    it after an edit. ctime cannot be set back with utime(), and size and
+    inode catch replaced files.
+
+    Args:
+        st: Result of stat() on the YAML file
+
+    Returns:
+        [mtime_ns, size, inode, ctime_ns] (a list, as it round-trips JSON)
+    """
+    return [st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns]
+
+
+def _read_yaml_cache(cache_file: Path, source: List[int]) -> Optional[Dict[str, Any]]:
+    """
+    Read a cached config dict if it was written for this version of the YAML.
+
+    Args:
+        cache_file: Path to the JSON sidecar
+        source: Cache key of the YAML file, from _yaml_cache_key()
+
+    Returns:
+        Cached config dict, or None if missing, stale or unreadable
+    """
+    try:
+        cached = _json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("source") != source:
+        return None
+    return cached.get("config")
+
+
+def _write_yaml_cache(
+    cache_file: Path, source: List[int], config_dict: Dict[str, Any], mode: int
+) -> None:
+    """
+    Write a parsed config dict to the JSON sidecar.
+
+    The sidecar holds everything in the YAML file (API keys included), so it
+    is created with the YAML file's permission bits, never the default umask.
+    It is written to a temporary file and renamed into place, so readers
+    never see a partial file.
+
+    Failures are ignored: the YAML file is simply parsed again next time.
+
+    Args:
+        cache_file: Path to the JSON sidecar
+        source: Cache key of the YAML file, from _yaml_cache_key()
+        config_dict: Parsed YAML configuration
+        mode: Permission bits for the sidecar
+    """
+    tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        payload = _json_dumps({"source": source, "config": config_dict})
+        fd = os.open(tmp_file, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, mode)
+        with os.fdopen(fd, "wb") as f:
+            # O_CREAT leaves the mode of a leftover temp file as it was
+            os.fchmod(f.fileno(), mode)
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+
+def _remove_yaml_cache(cache_file: Path) -> None:
+    """
+    Delete the JSON sidecar, if present.
+
+    Args:
+        cache_file: Path to the JSON sidecar
+    """
+    try:
+        os.unlink(cache_file)
+    except OSError:
+        pass
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode JSON to bytes, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj).encode("utf-8")
+    return orjson.dumps(obj)
+
+
+def _environment_fingerprint() -> str:
+    """
+    Hash the MMDVM_* environment variables that can override configuration.
+
+    Returns:
+        Hex digest identifying the current environment overrides
+    """
+    # Config reads the environment case-insensitively
+    mmdvm_env = sorted(
+        (k, v) for k, v in os.environ.items() if k.upper().startswith("MMDVM_")
+    )
+    return hashlib.blake2b(repr(mmdvm_env).encode()).hexdigest()
+
+
+@lru_cache(maxsize=4)
+def _build_config(path: str, mtime_ns: int, env_fingerprint: str) -> Config:
+    """
+    Build a validated Config, memoized across reloads.
+
+    mtime_ns and env_fingerprint are only used as cache keys, so an edited
+    config file or changed environment produces a fresh Config.
+
+    Args:
+        path: Path to YAML config file, or "" to use defaults
+        mtime_ns: Modification time of the config file (nanoseconds)
+        env_fingerprint: Hash of MMDVM_* environment variables
+
+    Returns:
+        Validated Config object
+    """
+    if path:
+        return Config.from_yaml(path)
+    return Config()
+
+
+def _default_config_path_or_empty() -> str:
+    """
+    Get the default configuration file path.
+
+    Returns:
+        Path as a string, or "" if no configuration file exists
+    """
+    try:
+        return str(Config.get_default_config_path())
+    except FileNotFoundError:
+        return ""
+
+
+def _mtime_ns(path: str) -> int:
+    """
+    Get a file's modification time for use as a cache key.
+
+    Args:
+        path: File path, or "" for none
+
+    Returns:
+        Modification time in nanoseconds, or 0 if unavailable (from_yaml
+        then reports the missing file)
+    """
+    if not path:
+        return 0
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """
     Load configuration with automatic path detection.
 
-    This is the primary entry point for configuration loading.
+    This is the primary entry point for configuration loading. Parsed
+    configuration is cached, so repeated calls for an unchanged file and
+    environment return the same Config object; treat it as read-only.
 
     Args:
         config_path: Optional explicit path to config file
@@ -347,15 +675,19 @@ def load_config(config_path: Optional[str] = None) -> Config:
         FileNotFoundError: If configuration file not found
         ValueError: If configuration is invalid
     """
+    env_fingerprint = _environment_fingerprint()
     if config_path:
-        config = Config.from_yaml(config_path)
+        config = _build_config(config_path, _mtime_ns(config_path), env_fingerprint)
     else:
+        path = _default_config_path_or_empty()
         try:
-            default_path = Config.get_default_config_path()
-            config = Config.from_yaml(str(default_path))
+            config = _build_config(path, _mtime_ns(path), env_fingerprint)
         except FileNotFoundError:
-            # Fall back to default config if no file found
-            config = Config()
+            # The cached default path has gone away: search again, falling
+            # back to the default config if nothing is found
+            _resolve_default_config_path.cache_clear()
+            path = _default_config_path_or_empty()
+            config = _build_config(path, _mtime_ns(path), env_fingerprint)
 
     # Perform runtime validation
     config.validate_runtime()
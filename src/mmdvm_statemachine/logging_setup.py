@@ -4,16 +4,185 @@ Logging configuration for MMDVMHost state machine.
 This module sets up structured logging for the application with proper
 formatting, rotation, and output to both file and console.
 
+Handlers run on a background QueueListener thread; loggers only enqueue
+records, so logging never blocks the asyncio event loop on file I/O. With
+batch_writes enabled, the listener thread also flushes each drained batch of
+records with a single write instead of one write per record.
+
 Logging is configured centrally and used throughout all modules.
 """
 
 import logging
+import os
+import queue
+import stat
 import sys
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set, Tuple, Type, cast
+
+from mmdvm_state_machine.config import DEFAULT_LOG_FORMAT, LoggingConfig
+
+# Background listener that owns the console/file handlers
+_queue_listener: Optional[QueueListener] = None
+
+# Log directories already created by setup_logging
+_ensured_dirs: Set[Path] = set()
+
+# Settings the running handlers were built with; a reload that only changes
+# level or format updates the existing handlers instead of reopening files
+_handler_settings: Optional[Tuple[object, ...]] = None
+
+
+class FastFormatter(logging.Formatter):
+    """
+    Formatter hard-wired to the default log format.
+
+    Produces the same output as logging.Formatter(DEFAULT_LOG_FORMAT) but
+    builds each line with a single f-string instead of %-style template
+    substitution, and reuses the strftime() result for every record logged
+    within the same second.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(DEFAULT_LOG_FORMAT)
+        # (second, formatted time) - a tuple so updates are atomic
+        self._time_cache: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_time = self._time_cache
+        if second != cached_second:
+            cached_time = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            self._time_cache = (second, cached_time)
+        if self.default_msec_format:
+            return self.default_msec_format % (cached_time, record.msecs)
+        return cached_time
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record)
+        s = f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += self.formatStack(record.stack_info)
+        return s
+
+
+class _BatchFlushMixin:
+    """
+    Handler mixin that leaves records in the stream buffer until the
+    listener's queue runs dry, instead of flushing after every record.
+    """
+
+    deferred = True
 
-from mmdvm_state_machine.config import LoggingConfig
+    def flush(self) -> None:
+        if not self.deferred:
+            super().flush()  # type: ignore[misc]
+
+    def flush_batch(self) -> None:
+        """Write out everything buffered since the last batch."""
+        super().flush()  # type: ignore[misc]
+
+
+class _BatchedStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    """StreamHandler that flushes once per batch."""
+
+
+class _BatchedFileHandler(_BatchFlushMixin, logging.FileHandler):
+    """FileHandler that flushes once per batch."""
+
+
+class _BatchedRotatingFileHandler(_BatchFlushMixin, RotatingFileHandler):
+    """
+    RotatingFileHandler that flushes once per batch.
+
+    The stock shouldRollover() stats the file and calls seek()/tell() on
+    every record, which flushes the stream; this tracks the size itself
+    between batches (counting characters, not encoded bytes) and resyncs it
+    from tell() after each batch is flushed.
+    """
+
+    _size = 0
+    _pending = 0
+    _regular_file = True
+
+    def _open(self):  # type: ignore[no-untyped-def]
+        stream = super()._open()
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:  # delay was set...
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._regular_file:
+            self._pending = 0
+            return False
+        self._pending = len(self.format(record)) + len(self.terminator)
+        return self._size + self._pending >= self.maxBytes
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # doRollover() reopens the stream, resetting _size
+        super().emit(record)
+        self._size += self._pending
+
+    def flush_batch(self) -> None:
+        super().flush_batch()
+        # Just flushed, so tell() is cheap; corrects multi-byte characters
+        # and external truncation
+        if self.stream is not None and self._regular_file:
+            try:
+                self._size = self.stream.tell()
+            except (OSError, ValueError):
+                pass
+
+
+class _BatchingQueueListener(QueueListener):
+    """
+    QueueListener that flushes batching handlers whenever the queue is empty.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        # setup_logging() always hands the listener a SimpleQueue of records
+        log_queue = cast("queue.SimpleQueue[logging.LogRecord]", self.queue)
+        try:
+            return log_queue.get(block=False)
+        except queue.Empty:
+            for handler in self.handlers:
+                if isinstance(handler, _BatchFlushMixin):
+                    handler.flush_batch()
+            return log_queue.get(block)
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """
+    Stop a queue listener and write out any records still buffered.
+
+    Args:
+        listener: Listener to stop
+    """
+    listener.stop()
+    for handler in listener.handlers:
+        if isinstance(handler, _BatchFlushMixin):
+            handler.flush_batch()
+            handler.deferred = False
 
 
 def setup_logging(config: LoggingConfig) -> logging.Logger:
@@ -25,6 +194,12 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
     - Console handler (stdout) for all logs
     - Rotating file handler (if file path specified)
     - Consistent formatting across all handlers
+    - A queue between the root logger and the handlers, drained by a
+      background thread (see stop_logging)
+
+    Calling this again with the same file, rotation and batching settings
+    (e.g. a reload that only changes the level) keeps the existing handlers
+    and updates their level and formatter in place.
 
     Args:
         config: Logging configuration
@@ -35,32 +210,71 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
     Raises:
         OSError: If log file cannot be created or written
     """
+    global _queue_listener, _handler_settings
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(config.level)
 
+    # Create formatter
+    if config.format == DEFAULT_LOG_FORMAT:
+        formatter: logging.Formatter = FastFormatter()
+    else:
+        formatter = logging.Formatter(config.format)
+
+    handler_settings = (config.file, config.rotation, config.batch_writes)
+    if _queue_listener is not None and handler_settings == _handler_settings:
+        for handler in _queue_listener.handlers:
+            handler.setLevel(config.level)
+            handler.setFormatter(formatter)
+        root_logger.info(
+            "Logging updated: level=%s, file=%s", config.level, config.file
+        )
+        return root_logger
+
+    # Flush and release handlers from a previous call
+    if _queue_listener is not None:
+        _stop_listener(_queue_listener)
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
 
-    # Create formatter
-    formatter = logging.Formatter(config.format)
+    stream_handler_class: Type[logging.StreamHandler]
+    file_handler_class: Type[logging.FileHandler]
+    rotating_handler_class: Type[RotatingFileHandler]
+    listener_class: Type[QueueListener]
+    if config.batch_writes:
+        stream_handler_class = _BatchedStreamHandler
+        file_handler_class = _BatchedFileHandler
+        rotating_handler_class = _BatchedRotatingFileHandler
+        listener_class = _BatchingQueueListener
+    else:
+        stream_handler_class = logging.StreamHandler
+        file_handler_class = logging.FileHandler
+        rotating_handler_class = RotatingFileHandler
+        listener_class = QueueListener
 
     # Console handler (stdout)
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = stream_handler_class(sys.stdout)
     console_handler.setLevel(config.level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if configured)
     if config.file:
         log_file_path = Path(config.file)
 
-        # Create directory if it doesn't exist
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create directory if it doesn't exist (once per process)
+        if log_file_path.parent not in _ensured_dirs:
+            log_file_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(log_file_path.parent)
 
         if config.rotation.enabled:
             # Rotating file handler
-            file_handler = RotatingFileHandler(
+            file_handler = rotating_handler_class(
                 filename=config.file,
                 maxBytes=config.rotation.max_bytes,
                 backupCount=config.rotation.backup_count,
@@ -68,23 +282,54 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
             )
         else:
             # Standard file handler
-            file_handler = logging.FileHandler(
+            file_handler = file_handler_class(
                 filename=config.file,
                 encoding="utf-8",
             )
 
         file_handler.setLevel(config.level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Root logger only enqueues records; the listener thread does the I/O
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = listener_class(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    _handler_settings = handler_settings
 
     # Log initial setup message
     root_logger.info(
-        f"Logging initialized: level={config.level}, file={config.file}"
+        "Logging initialized: level=%s, file=%s", config.level, config.file
     )
 
     return root_logger
 
 
+def stop_logging() -> None:
+    """
+    Stop the background logging thread.
+
+    Queued records are flushed, then the handlers are attached directly to
+    the root logger so anything logged during final shutdown is still
+    written. Safe to call more than once.
+    """
+    global _queue_listener, _handler_settings
+
+    if _queue_listener is None:
+        return
+
+    _handler_settings = None
+
+    listener, _queue_listener = _queue_listener, None
+    _stop_listener(listener)
+
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -115,10 +360,30 @@ class LoggerAdapter(logging.LoggerAdapter):
         # Output: ... - Processing request [request_id=12345]
     """
 
+    def __init__(self, logger: logging.Logger, extra: Optional[dict] = None) -> None:
+        """
+        Initialize the adapter.
+
+        The context suffix is built once here, so changes to extra after
+        construction are not reflected in messages.
+
+        Args:
+            logger: Underlying logger
+            extra: Context to append to every message
+        """
+        super().__init__(logger, extra)
+        if extra:
+            extra_str = " ".join(f"{k}={v}" for k, v in extra.items())
+            self._extra_suffix = f" [{extra_str}]"
+        else:
+            self._extra_suffix = ""
+
     def process(self, msg: str, kwargs: dict) -> tuple[str, dict]:
         """
         Process the logging message and keyword arguments.
 
+        Only called for records that pass the logger's level check.
+
         Args:
             msg: Log message
             kwargs: Keyword arguments
@@ -127,9 +392,8 @@ class LoggerAdapter(logging.LoggerAdapter):
             Tuple of (processed message, kwargs)
         """
         # Add extra context to message
-        if self.extra:
-            extra_str = " ".join(f"{k}={v}" for k, v in self.extra.items())
-            msg = f"{msg} [{extra_str}]"
+        if self._extra_suffix:
+            msg = f"{msg}{self._extra_suffix}"
         return msg, kwargs
 
 
@@ -183,9 +447,10 @@ def log_security_event(
             "ERROR"
         )
     """
-    message = f"SECURITY [{event_type}]: {details}"
     log_level = getattr(logging, severity.upper(), logging.WARNING)
-    logger.log(log_level, message)
+    if not logger.isEnabledFor(log_level):
+        return
+    logger.log(log_level, f"SECURITY [{event_type}]: {details}")
 
 
 def log_performance_metric(
@@ -209,5 +474,7 @@ def log_performance_metric(
     Example:
         log_performance_metric(logger, "qso_parse_time", 0.0023, "seconds")
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     unit_str = f" {unit}" if unit else ""
     logger.debug(f"METRIC [{metric_name}]: {value}{unit_str}")
@@ -4,18 +4,110 @@ Data models for MMDVMHost state machine.
 This module defines all core data structures used throughout the application,
 including QSO records, system state, and configuration models.
 
-All models use Pydantic for validation and serialization, ensuring type safety
-and easy JSON conversion for the REST API.
+Internal models (QSO, SystemState, Event, ...) are slotted dataclasses: they
+are created and updated for every parsed log line, and plain attribute
+assignment is much cheaper than Pydantic validation. Data arriving from
+outside (REST/WebSocket) is validated with the Pydantic QSOIn model before
+it becomes a QSO. Use to_dict() to get a JSON-ready dict of any model.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+import dataclasses
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import (
+    Optional,
+    Deque,
+    Dict,
+    Any,
+    FrozenSet,
+    List,
+    Iterable,
+    NamedTuple,
+    Tuple,
+    Union,
+    cast,
+)
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PlainSerializer, TypeAdapter
+from typing_extensions import Annotated
+
+try:
+    import orjson
+except ImportError:  # Optional, from the "performance" extra
+    orjson = None  # type: ignore[assignment]
+
+# slots/kw_only need Python 3.10+; older versions get plain dataclasses
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True, "kw_only": True} if sys.version_info >= (3, 10) else {}
+)
+
+# Bound once to skip the attribute lookup on every timestamp
+_now = datetime.now
+
+# Version 4 / RFC 4122 variant bits, as uuid.UUID(version=4) sets them
+_UUID4_CLEAR = ~((0xC000 << 48) | (0xF000 << 64))
+_UUID4_SET = (0x8000 << 48) | (0x4000 << 64)
+
+
+def _new_qso_id() -> int:
+    """
+    Generate a random QSO ID.
+
+    Same value space as uuid4().int, without building a UUID object.
+
+    Returns:
+        128-bit integer ID
+    """
+    return int.from_bytes(os.urandom(16), "big") & _UUID4_CLEAR | _UUID4_SET
+
+
+def format_qso_id(qso_id: int) -> str:
+    """
+    Format a QSO ID for the API.
+
+    Args:
+        qso_id: Integer QSO ID
+
+    Returns:
+        Canonical UUID string, as str(UUID(int=qso_id))
+    """
+    h = f"{qso_id:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# QSO IDs are plain ints internally and UUID strings in JSON
+_QSOId = Annotated[int, PlainSerializer(format_qso_id, return_type=str, when_used="json")]
+
+
+def _dict_factory(items: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a dict from dataclass fields, skipping private (underscore) fields.
+    """
+    return {k: v for k, v in items if k[0] != "_"}
+
+
+class _DictMixin:
+    """Adds to_dict() to model dataclasses."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dict for JSON serialization.
+
+        Returns:
+            Dict of field values
+        """
+        # Only ever mixed into dataclasses, which mypy can't see from here
+        return dataclasses.asdict(cast(Any, self), dict_factory=_dict_factory)
 
 
 class Mode(str, Enum):
@@ -36,6 +128,25 @@ class Mode(str, Enum):
     IDLE = "IDLE"
 
 
+class ModeValue:
+    """
+    Mode values as plain strings.
+
+    Models store modes as plain strings, so hot-path code can compare
+    against these (qso.mode == ModeValue.DMR) without touching the enum.
+    Must match Mode.
+    """
+
+    DSTAR = "DSTAR"
+    DMR = "DMR"
+    YSF = "YSF"
+    P25 = "P25"
+    NXDN = "NXDN"
+    POCSAG = "POCSAG"
+    FM = "FM"
+    IDLE = "IDLE"
+
+
 class QSOStatus(str, Enum):
     """
     QSO (contact) status states.
@@ -77,7 +188,61 @@ class NetworkStatus(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
-class QSO(BaseModel):
+# Enum value -> plain string lookups. Models store the plain string so
+# serialization never has to convert enum members.
+_MODE_VALUES: Dict[str, str] = {m.value: m.value for m in Mode}
+_QSO_STATUS_VALUES: Dict[str, str] = {s.value: s.value for s in QSOStatus}
+_MODEM_STATE_VALUES: Dict[str, str] = {s.value: s.value for s in ModemState}
+_NETWORK_STATUS_VALUES: Dict[str, str] = {s.value: s.value for s in NetworkStatus}
+
+# QSO statuses that count as active
+_ACTIVE_STATUSES: FrozenSet[str] = frozenset(
+    {QSOStatus.STARTING.value, QSOStatus.ACTIVE.value}
+)
+
+# Number of recent errors SystemState keeps for recent_errors()
+ERROR_RING_SIZE = 128
+
+# Mode value -> index into SystemState.mode_status
+_MODE_ORDINAL: Dict[str, int] = {m.value: i for i, m in enumerate(Mode)}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a callsign-like string so repeats share one object.
+
+    Args:
+        value: String or None
+
+    Returns:
+        The interned string, or value unchanged if it is not a str
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _check_value(values: Dict[str, str], value: str, name: str) -> str:
+    """
+    Validate an enum-valued field and return its plain string form.
+
+    Args:
+        values: Lookup of valid values
+        value: Value to check (string or enum member)
+        name: Field name for the error message
+
+    Returns:
+        The plain string value
+
+    Raises:
+        ValueError: If value is not a valid member
+    """
+    try:
+        return values[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid {name}: {value!r}") from None
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class QSO(_DictMixin):
     """
     Represents a single QSO (contact/transmission).
 
@@ -85,10 +250,170 @@ class QSO(BaseModel):
     including timing, participants, mode, and quality metrics.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    # Mode and status
+    mode: str  # Operating mode for this QSO (a Mode value)
+    status: str = "STARTING"  # A QSOStatus value
+
+    # Unique identifier (format_qso_id() gives the UUID string)
+    id: _QSOId = field(default_factory=_new_qso_id)
+
+    # Timing information (start_time defaults to now)
+    start_time: datetime = None  # type: ignore[assignment]
+    end_time: Optional[datetime] = None  # None while active
+    duration_seconds: Optional[float] = None
+
+    # Participants
+    source_callsign: Optional[str] = None  # Originating station
+    destination: Optional[str] = None  # Callsign, talk group, reflector, etc.
+
+    # Mode-specific information
+    slot: Optional[int] = None  # DMR slot (1 or 2)
+    talk_group: Optional[int] = None  # DMR/P25 talk group
+    source_id: Optional[int] = None  # DMR/P25 source ID
+    destination_id: Optional[int] = None  # DMR/P25 destination ID
+    reflector: Optional[str] = None  # YSF/DSTAR reflector
+
+    # Quality metrics
+    ber: Optional[float] = None  # Bit Error Rate (percentage)
+    rssi: Optional[int] = None  # Received Signal Strength Indicator
+    loss_rate: Optional[float] = None  # Packet loss rate (percentage)
+
+    # Source of transmission (True if RF, False if network)
+    rf_source: bool = True
+
+    # Additional mode-specific data (None until used; see ensure_metadata())
+    metadata: Optional[Dict[str, Any]] = None
+
+    # time.monotonic() at creation, if start_time was defaulted to now
+    _mono_start: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.mode = _check_value(_MODE_VALUES, self.mode, "mode")
+        self.status = _check_value(_QSO_STATUS_VALUES, self.status, "status")
+        # Callsigns, destinations and reflectors repeat across QSOs
+        self.source_callsign = _intern(self.source_callsign)
+        self.destination = _intern(self.destination)
+        self.reflector = _intern(self.reflector)
+        if self.start_time is None:
+            self.start_time = _now()
+            self._mono_start = time.monotonic()
+
+    def complete(self, end_time: Optional[datetime] = None) -> None:
+        """
+        Mark the QSO as completed and calculate duration.
+
+        QSOs timed from their creation use a monotonic clock for the
+        duration, so it is immune to wall-clock adjustments.
+
+        Args:
+            end_time: End time (defaults to now)
+        """
+        self.end_time = end_time or _now()
+        if end_time is None and self._mono_start is not None:
+            self.duration_seconds = time.monotonic() - self._mono_start
+        else:
+            self.duration_seconds = (self.end_time - self.start_time).total_seconds()
+        self.status = "COMPLETED"
+
+    def is_active(self) -> bool:
+        """
+        Check if the QSO is currently active.
+
+        Returns:
+            True if QSO is active, False otherwise
+        """
+        return self.status in _ACTIVE_STATUSES
+
+    def ensure_metadata(self) -> Dict[str, Any]:
+        """
+        Get the metadata dict, creating it on first use.
+
+        Most QSOs carry no metadata, so the dict is not allocated up front.
+
+        Returns:
+            The QSO's metadata dict
+        """
+        if self.metadata is None:
+            self.metadata = {}
+        return self.metadata
+
+    @classmethod
+    def from_json(cls, raw: Union[bytes, str]) -> QSO:
+        """
+        Validate a JSON QSO payload (e.g. a REST request body).
+
+        The JSON is validated directly by pydantic-core, without building
+        an intermediate Python dict.
+
+        Args:
+            raw: JSON document
+
+        Returns:
+            New QSO
+
+        Raises:
+            pydantic.ValidationError: If the payload is invalid
+        """
+        return QSOIn.model_validate_json(raw).to_qso()
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to JSON.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(self.to_dict(), option=orjson.OPT_UTC_Z)
+            except TypeError:
+                pass  # e.g. metadata orjson can't encode
+        return _QSO_ADAPTER.dump_json(self, exclude={"_mono_start"})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dict for JSON serialization.
+
+        Returns:
+            Dict of field values, with the ID as a UUID string
+        """
+        # Built directly: asdict() deep-copies every value, which costs
+        # several times more than the rest of serialization
+        data = {name: getattr(self, name) for name in _QSO_FIELDS}
+        data["id"] = format_qso_id(self.id)
+        if self.metadata is not None:
+            data["metadata"] = dict(self.metadata)
+        return data
+
 
-    # Unique identifier
-    id: UUID = Field(default_factory=uuid4, description="Unique QSO identifier")
+# Public fields of QSO, in declaration order
+_QSO_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(QSO) if f.name[0] != "_"
+)
+
+
+class QSOIn(BaseModel):
+    """
+    Validated QSO data received through the REST API or WebSocket.
+
+    This is the only place QSO data is validated; call to_qso() to get the
+    internal QSO record. Data parsed from log lines is already typed and
+    should construct a QSO directly instead (about 3us against 5us through
+    QSOIn). QSOIn.model_construct() is not a shortcut: with this model's
+    defaults it measured roughly 40x slower than validating.
+    """
+
+    # When models.py is compiled with Cython its methods are cyfunctions,
+    # which pydantic would otherwise mistake for unannotated fields
+    model_config = ConfigDict(ignored_types=(type(_check_value),))
+
+    # Mode and status (enums here; QSO stores their plain string values)
+    mode: Mode = Field(..., description="Operating mode for this QSO")
+    status: QSOStatus = Field(
+        QSOStatus.STARTING, description="Current status of the QSO"
+    )
 
     # Timing information
     start_time: datetime = Field(
@@ -101,12 +426,6 @@ class QSO(BaseModel):
         None, description="QSO duration in seconds"
     )
 
-    # Mode and status
-    mode: Mode = Field(..., description="Operating mode for this QSO")
-    status: QSOStatus = Field(
-        QSOStatus.STARTING, description="Current status of the QSO"
-    )
-
     # Participants
     source_callsign: Optional[str] = Field(
         None, description="Source callsign (originating station)"
@@ -131,47 +450,50 @@ class QSO(BaseModel):
     rf_source: bool = Field(True, description="True if RF source, False if network")
 
     # Additional metadata
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict, description="Additional mode-specific data"
+    metadata: Optional[Dict[str, Any]] = Field(
+        None, description="Additional mode-specific data"
     )
 
-    def complete(self, end_time: Optional[datetime] = None) -> None:
-        """
-        Mark the QSO as completed and calculate duration.
-
-        Args:
-            end_time: End time (defaults to now)
+    def to_qso(self) -> QSO:
         """
-        self.end_time = end_time or datetime.now()
-        delta = self.end_time - self.start_time
-        self.duration_seconds = delta.total_seconds()
-        self.status = QSOStatus.COMPLETED
-
-    def is_active(self) -> bool:
-        """
-        Check if the QSO is currently active.
+        Create an internal QSO record from the validated data.
 
         Returns:
-            True if QSO is active, False otherwise
+            New QSO with a fresh ID
         """
-        return self.status in (QSOStatus.STARTING, QSOStatus.ACTIVE)
+        # __dict__ holds exactly the field values; dict(self) goes through
+        # BaseModel.__iter__, which costs more than building the QSO
+        return QSO(**self.__dict__)
 
 
-class ModeStatus(BaseModel):
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class ModeStatus(_DictMixin):
     """
     Status information for a specific mode.
-    """
 
-    model_config = ConfigDict(use_enum_values=True)
+    Immutable and hashable; use SystemState.update_mode_status() to change
+    a mode's status.
+    """
 
-    mode: Mode
+    mode: str  # A Mode value
     enabled: bool = True
-    network_status: NetworkStatus = NetworkStatus.UNKNOWN
+    network_status: str = "UNKNOWN"  # A NetworkStatus value
     network_name: Optional[str] = None
     last_activity: Optional[datetime] = None
 
+    def __post_init__(self) -> None:
+        # Frozen: normalize through object.__setattr__
+        object.__setattr__(self, "mode", _check_value(_MODE_VALUES, self.mode, "mode"))
+        object.__setattr__(
+            self,
+            "network_status",
+            _check_value(_NETWORK_STATUS_VALUES, self.network_status, "network_status"),
+        )
+        object.__setattr__(self, "network_name", _intern(self.network_name))
 
-class SystemState(BaseModel):
+
+@dataclass(**_DATACLASS_OPTIONS)
+class SystemState(_DictMixin):
     """
     Complete system state snapshot.
 
@@ -179,80 +501,138 @@ class SystemState(BaseModel):
     including active QSOs, mode information, and system status.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
-
     # Current operational state
-    current_mode: Mode = Field(Mode.IDLE, description="Current active mode")
-    modem_state: ModemState = Field(
-        ModemState.UNKNOWN, description="Physical modem state"
-    )
+    current_mode: str = "IDLE"  # A Mode value
+    modem_state: str = "UNKNOWN"  # Physical modem state (a ModemState value)
 
-    # Active QSOs
-    active_qsos: List[QSO] = Field(
-        default_factory=list, description="Currently active QSOs"
-    )
+    # Currently active QSOs, keyed by QSO ID (in insertion order)
+    active_qsos: Dict[int, QSO] = field(default_factory=dict)
 
-    # Mode status
-    mode_status: Dict[Mode, ModeStatus] = Field(
-        default_factory=dict, description="Status for each mode"
+    # Status for each mode, indexed by _MODE_ORDINAL (None if not reported)
+    mode_status: List[Optional[ModeStatus]] = field(
+        default_factory=lambda: [None] * len(_MODE_ORDINAL)
     )
 
-    # System information
-    last_update: datetime = Field(
-        default_factory=datetime.now, description="Last state update timestamp"
-    )
-    uptime_seconds: Optional[float] = Field(
-        None, description="System uptime in seconds"
-    )
+    # System information (last_update is refreshed by snapshot())
+    last_update: datetime = field(default_factory=_now)
+    uptime_seconds: Optional[float] = None
 
     # Error tracking
-    error_count: int = Field(0, description="Total error count since startup")
-    last_error: Optional[str] = Field(None, description="Last error message")
-    last_error_time: Optional[datetime] = Field(
-        None, description="Last error timestamp"
+    error_count: int = 0  # Total errors since startup
+    last_error: Optional[str] = None
+    last_error_time: Optional[datetime] = None
+
+    # Recent errors as (time.monotonic(), message), oldest dropped first
+    _error_ring: Deque[Tuple[float, str]] = field(
+        default_factory=lambda: deque(maxlen=ERROR_RING_SIZE),
+        init=False,
+        repr=False,
+        compare=False,
     )
 
+    # Set by mutators; snapshot() stamps last_update once and clears it
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.current_mode = _check_value(_MODE_VALUES, self.current_mode, "mode")
+        self.modem_state = _check_value(
+            _MODEM_STATE_VALUES, self.modem_state, "modem_state"
+        )
+
     def add_active_qso(self, qso: QSO) -> None:
         """
-        Add a QSO to the active list.
+        Add a QSO to the active set.
 
         Args:
             qso: QSO to add
         """
-        self.active_qsos.append(qso)
-        self.last_update = datetime.now()
+        self.active_qsos[qso.id] = qso
+        self._dirty = True
 
-    def remove_active_qso(self, qso_id: UUID) -> Optional[QSO]:
+    def remove_active_qso(self, qso_id: int) -> Optional[QSO]:
         """
-        Remove a QSO from the active list.
+        Remove a QSO from the active set.
 
         Args:
-            qso_id: UUID of QSO to remove
+            qso_id: ID of QSO to remove
 
         Returns:
             The removed QSO if found, None otherwise
         """
-        for i, qso in enumerate(self.active_qsos):
-            if qso.id == qso_id:
-                removed = self.active_qsos.pop(i)
-                self.last_update = datetime.now()
-                return removed
-        return None
+        removed = self.active_qsos.pop(qso_id, None)
+        if removed is not None:
+            self._dirty = True
+        return removed
 
-    def get_active_qso_by_id(self, qso_id: UUID) -> Optional[QSO]:
+    def get_active_qso_by_id(self, qso_id: int) -> Optional[QSO]:
         """
         Retrieve an active QSO by its ID.
 
         Args:
-            qso_id: UUID of QSO to find
+            qso_id: ID of QSO to find
 
         Returns:
             QSO if found, None otherwise
         """
-        for qso in self.active_qsos:
-            if qso.id == qso_id:
-                return qso
-        return None
+        return self.active_qsos.get(qso_id)
+
+    def get_mode_status(self, mode: str) -> Optional[ModeStatus]:
+        """
+        Retrieve the status of a mode.
+
+        Args:
+            mode: Mode value
+
+        Returns:
+            ModeStatus if one has been set, None otherwise
+        """
+        return self.mode_status[_MODE_ORDINAL[mode]]
+
+    def set_mode_status(self, status: ModeStatus) -> None:
+        """
+        Set the status of a mode.
+
+        Args:
+            status: New status, stored under status.mode
+        """
+        self.mode_status[_MODE_ORDINAL[status.mode]] = status
+        self._dirty = True
+
+    def update_mode_status(self, mode: str, **changes: Any) -> ModeStatus:
+        """
+        Replace the status of a mode with an updated copy.
+
+        Args:
+            mode: Mode value
+            **changes: ModeStatus fields to change
+
+        Returns:
+            The new ModeStatus
+        """
+        current = self.get_mode_status(mode)
+        if current is None:
+            status = ModeStatus(mode=mode, **changes)
+        else:
+            status = dataclasses.replace(current, **changes)
+        self.set_mode_status(status)
+        return status
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dict for JSON serialization.
+
+        Returns:
+            Dict of field values, with active_qsos as a list and
+            mode_status as a dict keyed by mode
+        """
+        # Built directly: asdict() would deep-copy the QSOs and error ring
+        # only for them to be replaced or dropped
+        data = {name: getattr(self, name) for name in _SYSTEM_STATE_FIELDS}
+        data["active_qsos"] = [qso.to_dict() for qso in self.active_qsos.values()]
+        data["mode_status"] = {
+            status.mode: status.to_dict() for status in self.mode_status if status is not None
+        }
+        return data
 
     def record_error(self, error_message: str) -> None:
         """
@@ -263,65 +643,202 @@ class SystemState(BaseModel):
         """
         self.error_count += 1
         self.last_error = error_message
-        self.last_error_time = datetime.now()
-        self.last_update = datetime.now()
+        self.last_error_time = self.last_update = _now()
+        self._error_ring.append((time.monotonic(), error_message))
+        self._dirty = False
+
+    def recent_errors(self) -> List[Tuple[datetime, str]]:
+        """
+        Get the most recent errors, oldest first.
+
+        At most ERROR_RING_SIZE errors are kept.
+
+        Returns:
+            List of (timestamp, message) tuples
+        """
+        now, mono_now = _now(), time.monotonic()
+        return [
+            (now - timedelta(seconds=mono_now - mono), message)
+            for mono, message in self._error_ring
+        ]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the state for broadcasting.
+
+        last_update is stamped here, once per snapshot, rather than on every
+        mutation, so a burst of log lines costs a single clock read.
+
+        Returns:
+            Dict of field values, as to_dict()
+        """
+        if self._dirty:
+            self.last_update = _now()
+            self._dirty = False
+        return self.to_dict()
+
 
+# Public fields of SystemState, in declaration order
+_SYSTEM_STATE_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(SystemState) if f.name[0] != "_"
+)
 
-class Event(BaseModel):
+
+class _EventFields(NamedTuple):
+    event_type: str  # qso_started, mode_changed, etc.
+    event_id: UUID
+    timestamp: datetime
+    data: Dict[str, Any]  # Event-specific data
+    severity: str  # For filtering (info, warning, error)
+
+
+class Event(_EventFields):
     """
     System event for WebSocket broadcasting.
 
     Events represent state changes that should be pushed to connected clients.
+    They are immutable tuples, so one instance can be shared by every
+    subscriber.
     """
 
-    model_config = ConfigDict(use_enum_values=True)
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        event_type: str,
+        event_id: Optional[UUID] = None,
+        timestamp: Optional[datetime] = None,
+        data: Optional[Dict[str, Any]] = None,
+        severity: str = "info",
+    ) -> Event:
+        return tuple.__new__(
+            cls,
+            (
+                event_type,
+                event_id or uuid4(),
+                timestamp or _now(),
+                {} if data is None else data,
+                severity,
+            ),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dict for JSON serialization.
 
-    # Event identification
-    event_id: UUID = Field(default_factory=uuid4, description="Unique event identifier")
-    event_type: str = Field(..., description="Event type (qso_started, mode_changed, etc.)")
-    timestamp: datetime = Field(
-        default_factory=datetime.now, description="Event timestamp"
-    )
+        Returns:
+            Dict of field values
+        """
+        return self._asdict()
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to JSON.
+
+        Serialize once and send the same bytes to every WebSocket client.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(self._asdict(), option=orjson.OPT_UTC_Z)
+            except TypeError:
+                pass  # e.g. event data orjson can't encode
+        return _JSON_OBJECT_ADAPTER.dump_json(self._asdict())
 
-    # Event data
-    data: Dict[str, Any] = Field(
-        default_factory=dict, description="Event-specific data"
-    )
 
-    # Severity (for filtering)
-    severity: str = Field("info", description="Event severity (info, warning, error)")
+class _HealthStatusFields(NamedTuple):
+    healthy: bool  # Overall health status
+    version: str  # Application version
+    uptime_seconds: float
+
+    # Component health
+    log_monitor_active: bool
+    state_machine_active: bool
+    api_server_active: bool
+
+    # Statistics
+    total_qsos_processed: int = 0  # Since start
+    active_websocket_connections: int = 0
+
+    # Errors
+    error_count: int = 0  # Since start
+    last_error: Optional[str] = None
+
+    # Timestamps
+    last_log_update: Optional[datetime] = None  # Last log file update processed
+    current_time: Optional[datetime] = None  # Defaults to now
 
 
-class HealthStatus(BaseModel):
+class HealthStatus(_HealthStatusFields):
     """
     Application health status.
 
     Used for monitoring and health check endpoints.
     """
 
-    healthy: bool = Field(..., description="Overall health status")
-    version: str = Field(..., description="Application version")
-    uptime_seconds: float = Field(..., description="Application uptime")
+    __slots__ = ()
 
-    # Component health
-    log_monitor_active: bool = Field(..., description="Log monitor is running")
-    state_machine_active: bool = Field(..., description="State machine is active")
-    api_server_active: bool = Field(..., description="API server is running")
+    def __new__(cls, *args: Any, **kwargs: Any) -> HealthStatus:
+        self = super().__new__(cls, *args, **kwargs)
+        if self.current_time is None:
+            return self._replace(current_time=_now())
+        return self
 
-    # Statistics
-    total_qsos_processed: int = Field(0, description="Total QSOs processed since start")
-    active_websocket_connections: int = Field(
-        0, description="Current WebSocket connections"
-    )
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dict for JSON serialization.
 
-    # Errors
-    error_count: int = Field(0, description="Total errors since start")
-    last_error: Optional[str] = Field(None, description="Most recent error")
+        Returns:
+            Dict of field values
+        """
+        return self._asdict()
 
-    # Timestamps
-    last_log_update: Optional[datetime] = Field(
-        None, description="Last log file update processed"
-    )
-    current_time: datetime = Field(
-        default_factory=datetime.now, description="Current server time"
-    )
+
+def serialize_qsos_json(qsos: Iterable[QSO]) -> bytes:
+    """
+    Serialize QSOs to a JSON array.
+
+    Args:
+        qsos: QSOs to serialize, e.g. SystemState.active_qsos.values()
+
+    Returns:
+        UTF-8 encoded JSON array
+    """
+    qsos = list(qsos)
+    if orjson is not None:
+        try:
+            return orjson.dumps([qso.to_dict() for qso in qsos], option=orjson.OPT_UTC_Z)
+        except TypeError:
+            pass
+    return _QSO_LIST_ADAPTER.dump_json(qsos, exclude={"__all__": {"_mono_start"}})
+
+
+def serialize_events_json(events: Iterable[Event]) -> bytes:
+    """
+    Serialize events to a JSON array.
+
+    Args:
+        events: Events to serialize
+
+    Returns:
+        UTF-8 encoded JSON array
+    """
+    items = [event._asdict() for event in events]
+    if orjson is not None:
+        try:
+            return orjson.dumps(items, option=orjson.OPT_UTC_Z)
+        except TypeError:
+            pass
+    return _JSON_OBJECT_LIST_ADAPTER.dump_json(items)
+
+
+# Serializers built once at import rather than per call
+_QSO_ADAPTER: TypeAdapter[QSO] = TypeAdapter(QSO)
+_JSON_OBJECT_ADAPTER: TypeAdapter[Dict[str, Any]] = TypeAdapter(Dict[str, Any])
+_QSO_LIST_ADAPTER: TypeAdapter[List[QSO]] = TypeAdapter(List[QSO])
+# Events are tuples; serialize their _asdict() form so they come out as objects
+_JSON_OBJECT_LIST_ADAPTER: TypeAdapter[List[Dict[str, Any]]] = TypeAdapter(
+    List[Dict[str, Any]]
+)
@@ -5,6 +5,7 @@ Tests YAML loading, validation, and environment variable overrides.
 """
 
 import os
+import stat
 import pytest
 import tempfile
 from pathlib import Path
@@ -36,6 +37,25 @@ class TestLogMonitoringConfig:
         with pytest.raises(ValueError, match="must be an absolute path"):
             LogMonitoringConfig(log_directory="relative/path")
 
+    def test_compiled_pattern(self):
+        """Test log_path_pattern is compiled to a matching regex."""
+        config = LogMonitoringConfig()
+
+        assert config.compiled_pattern.match("/var/log/mmdvm/MMDVM-2024-01-01.log")
+        assert not config.compiled_pattern.match("/var/log/mmdvm/other.log")
+        assert config.compiled_pattern is config.compiled_pattern
+
+    def test_pattern_parts(self):
+        """Test log_path_pattern splits into literal dir and wildcard tail."""
+        config = LogMonitoringConfig()
+        assert config.pattern_parts == (Path("/var/log/mmdvm"), "MMDVM-*.log")
+
+        config = LogMonitoringConfig(log_path_pattern="/var/log/*/MMDVM-*.log")
+        assert config.pattern_parts == (Path("/var/log"), "*/MMDVM-*.log")
+
+        config = LogMonitoringConfig(log_path_pattern="/var/log/mmdvm/MMDVM.log")
+        assert config.pattern_parts == (Path("/var/log/mmdvm"), "MMDVM.log")
+
 
 class TestStateMachineConfig:
     """Tests for state machine configuration."""
@@ -49,6 +69,12 @@ class TestStateMachineConfig:
         assert "DMR" in config.supported_modes
         assert "YSF" in config.supported_modes
 
+    def test_supported_modes_normalized(self):
+        """Test supported modes become an upper-case frozenset."""
+        config = StateMachineConfig(supported_modes=["dmr", "YSF", "DMR"])
+
+        assert config.supported_modes == frozenset({"DMR", "YSF"})
+
     def test_history_size_validation(self):
         """Test QSO history size validation."""
         # Valid range
@@ -133,7 +159,7 @@ class TestLoggingConfig:
 
 
 class TestConfigFromYAML:
-    """Tests for loading configuration from YAML files."""
+    """Tests for loading configuration from YAML."""
 
     def test_load_minimal_yaml(self):
         """Test loading minimal YAML configuration."""
@@ -146,22 +172,13 @@ logging:
   level: DEBUG
   file: /tmp/test.log
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            f.write(yaml_content)
-            yaml_path = f.name
-
-        try:
-            config = Config.from_yaml(yaml_path)
+        config = Config.from_yaml_str(yaml_content)
 
-            assert config.log_monitoring.log_directory == "/tmp/mmdvm-test"
-            assert config.logging.level == "DEBUG"
-            assert config.logging.file == "/tmp/test.log"
-            # Defaults should still work
-            assert config.api.port == 8080
-        finally:
-            os.unlink(yaml_path)
+        assert config.log_monitoring.log_directory == "/tmp/mmdvm-test"
+        assert config.logging.level == "DEBUG"
+        assert config.logging.file == "/tmp/test.log"
+        # Defaults should still work
+        assert config.api.port == 8080
 
     def test_load_complete_yaml(self):
         """Test loading complete YAML configuration."""
@@ -184,24 +201,15 @@ logging:
   level: WARNING
   file: /tmp/app.log
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            f.write(yaml_content)
-            yaml_path = f.name
+        config = Config.from_yaml_str(yaml_content)
 
-        try:
-            config = Config.from_yaml(yaml_path)
-
-            assert config.log_monitoring.rotation_check_interval == 30
-            assert config.state_machine.qso_history_size == 200
-            assert config.state_machine.qso_timeout_seconds == 60
-            assert config.api.host == "127.0.0.1"
-            assert config.api.port == 9090
-            assert config.api.enable_cors is False
-            assert config.logging.level == "WARNING"
-        finally:
-            os.unlink(yaml_path)
+        assert config.log_monitoring.rotation_check_interval == 30
+        assert config.state_machine.qso_history_size == 200
+        assert config.state_machine.qso_timeout_seconds == 60
+        assert config.api.host == "127.0.0.1"
+        assert config.api.port == 9090
+        assert config.api.enable_cors is False
+        assert config.logging.level == "WARNING"
 
     def test_load_nonexistent_file(self):
         """Test loading non-existent file raises error."""
@@ -210,20 +218,141 @@ logging:
 
     def test_load_empty_yaml(self):
         """Test loading empty YAML uses defaults."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as f:
-            f.write("")  # Empty file
-            yaml_path = f.name
+        config = Config.from_yaml_str("")
 
-        try:
-            config = Config.from_yaml(yaml_path)
+        # Should use all defaults
+        assert config.api.port == 8080
+        assert config.logging.level == "INFO"
 
-            # Should use all defaults
-            assert config.api.port == 8080
-            assert config.logging.level == "INFO"
-        finally:
-            os.unlink(yaml_path)
+    def test_load_yaml_with_env_override(self, monkeypatch):
+        """Test environment variables still apply on top of YAML sections."""
+        monkeypatch.setenv("MMDVM_API__HOST", "127.0.0.1")
+        config = Config.from_yaml_str("api:\n  port: 9090\nwebsocket:\n")
+
+        assert config.api.port == 9090
+        assert config.api.host == "127.0.0.1"
+        assert config.websocket.max_connections == 50
+
+    def test_yaml_cache_written_when_enabled(self):
+        """Test parsed YAML is cached as JSON when yaml_cache is enabled."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text(
+                "api:\n  port: 9090\nperformance:\n  yaml_cache: true\n"
+            )
+            cache_path = Path(tmpdir) / "config.yaml.cache.json"
+
+            config = Config.from_yaml(str(yaml_path))
+            assert config.api.port == 9090
+            assert cache_path.exists()
+
+            # Cached copy is used while the YAML mtime is unchanged
+            config = Config.from_yaml(str(yaml_path))
+            assert config.api.port == 9090
+            assert config.performance.yaml_cache is True
+
+    def test_yaml_cache_not_written_by_default(self):
+        """Test no cache sidecar is written unless enabled."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text("api:\n  port: 9090\n")
+
+            Config.from_yaml(str(yaml_path))
+
+            assert not (Path(tmpdir) / "config.yaml.cache.json").exists()
+
+    def test_yaml_cache_ignored_when_stale(self):
+        """Test a cache written for an older YAML mtime is ignored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text(
+                "api:\n  port: 9090\nperformance:\n  yaml_cache: true\n"
+            )
+            Config.from_yaml(str(yaml_path))
+
+            yaml_path.write_text("api:\n  port: 9191\n")
+            st = yaml_path.stat()
+            os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            config = Config.from_yaml(str(yaml_path))
+            assert config.api.port == 9191
+
+    def test_yaml_cache_ignored_when_edited_with_mtime_preserved(self):
+        """Test an edit that restores the YAML mtime still invalidates the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text(
+                "api:\n  port: 9090\nperformance:\n  yaml_cache: true\n"
+            )
+            st = yaml_path.stat()
+            Config.from_yaml(str(yaml_path))
+
+            # Same size, same inode, same mtime: only the ctime differs
+            yaml_path.write_text(
+                "api:\n  port: 7000\nperformance:\n  yaml_cache: true\n"
+            )
+            os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+            config = Config.from_yaml(str(yaml_path))
+            assert config.api.port == 7000
+
+    def test_yaml_cache_uses_validated_setting(self, monkeypatch):
+        """Test the cache decision follows the validated config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            cache_path = Path(tmpdir) / "config.yaml.cache.json"
+
+            yaml_path.write_text('performance:\n  yaml_cache: "false"\n')
+            Config.from_yaml(str(yaml_path))
+            assert not cache_path.exists()
+
+            # Enabled only through the environment
+            yaml_path.write_text("api:\n  port: 9090\n")
+            monkeypatch.setenv("MMDVM_PERFORMANCE__YAML_CACHE", "true")
+            Config.from_yaml(str(yaml_path))
+            assert cache_path.exists()
+
+    def test_yaml_cache_not_written_for_invalid_config(self):
+        """Test a config that fails validation is not cached."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text("api:\n  port: 0\nperformance:\n  yaml_cache: true\n")
+
+            with pytest.raises(ValueError):
+                Config.from_yaml(str(yaml_path))
+
+            assert not (Path(tmpdir) / "config.yaml.cache.json").exists()
+
+    def test_yaml_cache_keeps_yaml_permissions(self):
+        """Test the cache sidecar is no more readable than the YAML file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text(
+                "api:\n  api_keys:\n    admin: s3cret\nperformance:\n  yaml_cache: true\n"
+            )
+            os.chmod(yaml_path, 0o600)
+
+            Config.from_yaml(str(yaml_path))
+
+            cache_path = Path(tmpdir) / "config.yaml.cache.json"
+            assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
+            assert sorted(os.listdir(tmpdir)) == ["config.yaml", "config.yaml.cache.json"]
+
+    def test_yaml_cache_removed_when_disabled(self):
+        """Test an existing sidecar is deleted once yaml_cache is turned off."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text("performance:\n  yaml_cache: true\n")
+            Config.from_yaml(str(yaml_path))
+            cache_path = Path(tmpdir) / "config.yaml.cache.json"
+            assert cache_path.exists()
+
+            yaml_path.write_text("performance:\n  yaml_cache: false\n")
+            st = yaml_path.stat()
+            os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            Config.from_yaml(str(yaml_path))
+
+            assert not cache_path.exists()
 
 
 class TestConfigValidation:
@@ -241,6 +370,60 @@ class TestConfigValidation:
         with pytest.raises(ValueError, match="does not exist"):
             config.validate_runtime()
 
+    def test_validate_runtime_paths_under_a_file(self):
+        """Test paths below a regular file are reported as ValueError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            regular_file = Path(tmpdir) / "file"
+            regular_file.write_text("")
+
+            config = Config(
+                log_monitoring=LogMonitoringConfig(log_directory=f"{regular_file}/logs"),
+                logging=LoggingConfig(file=f"{tmpdir}/app.log"),
+            )
+            with pytest.raises(ValueError, match="does not exist"):
+                config.validate_runtime()
+
+            config = Config(
+                log_monitoring=LogMonitoringConfig(log_directory=tmpdir),
+                logging=LoggingConfig(file=f"{regular_file}/logs/app.log"),
+            )
+            with pytest.raises(ValueError, match="Cannot create log directory"):
+                config.validate_runtime()
+
+    def test_validate_runtime_unreadable_log_directory(self, monkeypatch):
+        """Test validation fails if log directory is not readable."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Simulate an unreadable directory, even when running as root
+            real_access = os.access
+            monkeypatch.setattr(
+                os,
+                "access",
+                lambda path, mode: mode != os.R_OK and real_access(path, mode),
+            )
+
+            config = Config(
+                log_monitoring=LogMonitoringConfig(log_directory=tmpdir),
+                logging=LoggingConfig(file=None),
+            )
+
+            with pytest.raises(ValueError, match="not readable"):
+                config.validate_runtime()
+
+    @pytest.mark.skipif(
+        not os.path.isdir("/proc/sys") or os.access("/proc/sys", os.W_OK),
+        reason="needs the read-only /proc/sys mount",
+    )
+    def test_validate_runtime_read_only_log_directory(self):
+        """Test a log directory on a read-only mount fails validation."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Config(
+                log_monitoring=LogMonitoringConfig(log_directory=tmpdir),
+                logging=LoggingConfig(file="/proc/sys/app.log"),
+            )
+
+            with pytest.raises(ValueError, match="not writable"):
+                config.validate_runtime()
+
     def test_validate_runtime_creates_app_log_directory(self):
         """Test validation creates app log directory if needed."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -293,3 +476,74 @@ logging:
         finally:
             if Path(yaml_path).exists():
                 os.unlink(yaml_path)
+
+    def test_load_config_reuses_unchanged_config(self):
+        """Test repeated loads of an unchanged file reuse the parsed Config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text(
+                f"log_monitoring:\n  log_directory: {tmpdir}\n"
+                f"logging:\n  file: {tmpdir}/app.log\n"
+            )
+
+            first = load_config(str(yaml_path))
+            assert load_config(str(yaml_path)) is first
+
+            yaml_path.write_text(
+                f"log_monitoring:\n  log_directory: {tmpdir}\n"
+                f"logging:\n  level: DEBUG\n  file: {tmpdir}/app.log\n"
+            )
+            st = yaml_path.stat()
+            os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            reloaded = load_config(str(yaml_path))
+            assert reloaded is not first
+            assert reloaded.logging.level == "DEBUG"
+
+    def test_load_config_lowercase_env_override(self, monkeypatch):
+        """Test lower-case MMDVM_ variables invalidate the cached Config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text(
+                f"log_monitoring:\n  log_directory: {tmpdir}\n"
+                f"logging:\n  file: {tmpdir}/app.log\n"
+            )
+
+            assert load_config(str(yaml_path)).api.port == 8080
+
+            monkeypatch.setenv("mmdvm_api__port", "9999")
+
+            assert load_config(str(yaml_path)).api.port == 9999
+
+    def test_load_config_default_path_removed(self, monkeypatch):
+        """Test a deleted default config file is re-resolved on reload."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_dir = Path(tmpdir) / "env"
+            cwd_dir = Path(tmpdir) / "cwd"
+            env_dir.mkdir()
+            cwd_dir.mkdir()
+            base = (
+                f"log_monitoring:\n  log_directory: {tmpdir}\n"
+                f"logging:\n  file: {tmpdir}/app.log\n"
+            )
+            env_yaml = env_dir / "config.yaml"
+            env_yaml.write_text(base + "api:\n  port: 9090\n")
+            (cwd_dir / "config.yaml").write_text(base + "api:\n  port: 9191\n")
+            monkeypatch.chdir(cwd_dir)
+            monkeypatch.setenv("MMDVM_CONFIG", str(env_yaml))
+
+            assert load_config().api.port == 9090
+
+            env_yaml.unlink()
+
+            assert load_config().api.port == 9191
+
+    def test_default_config_path_from_env(self, monkeypatch):
+        """Test MMDVM_CONFIG is used as the default config path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_path = Path(tmpdir) / "config.yaml"
+            yaml_path.write_text("")
+            monkeypatch.setenv("MMDVM_CONFIG", str(yaml_path))
+
+            assert Config.get_default_config_path() == yaml_path
+            assert Config.get_default_config_path() == yaml_path
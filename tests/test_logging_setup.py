@@ -0,0 +1,361 @@
+"""
+Unit tests for logging configuration.
+
+Tests the batching handlers, the queue listener lifecycle, reconfiguration
+and the logging helpers.
+"""
+
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from mmdvm_state_machine import logging_setup
+from mmdvm_state_machine.config import DEFAULT_LOG_FORMAT, LoggingConfig, LogRotationConfig
+from mmdvm_state_machine.logging_setup import (
+    FastFormatter,
+    LoggerAdapter,
+    _BatchedRotatingFileHandler,
+    log_performance_metric,
+    log_security_event,
+    setup_logging,
+    stop_logging,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_logging():
+    """Stop the listener and drop root handlers after each test."""
+    yield
+    stop_logging()
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        handler.close()
+    root_logger.handlers.clear()
+
+
+def wait_for(predicate, timeout=5.0):
+    """Poll until predicate() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class ListHandler(logging.Handler):
+    """Collect formatted messages in a list."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def captured():
+    """A non-propagating logger at INFO and the handler capturing it."""
+    logger = logging.getLogger("mmdvm.test.captured")
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger, handler
+    logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+
+def make_record(msg="hello %s", args=("world",), exc_info=None, sinfo=None, created=None):
+    """Build a LogRecord, optionally with a fixed creation time."""
+    record = logging.LogRecord(
+        "mmdvm.test", logging.WARNING, __file__, 42, msg, args, exc_info, sinfo=sinfo
+    )
+    if created is not None:
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+    return record
+
+
+class TestFastFormatter:
+    """Tests that FastFormatter matches logging.Formatter(DEFAULT_LOG_FORMAT)."""
+
+    def assert_same(self, *make_args, **make_kwargs):
+        # Separate records (formatting caches exc_text on the record) with a
+        # fixed creation time so both carry the same timestamp
+        make_kwargs.setdefault("created", time.time())
+        expected = logging.Formatter(DEFAULT_LOG_FORMAT).format(
+            make_record(*make_args, **make_kwargs)
+        )
+        actual = FastFormatter().format(make_record(*make_args, **make_kwargs))
+        assert actual == expected
+
+    def test_plain_record(self):
+        """Test a plain record formats identically."""
+        self.assert_same()
+
+    def test_records_within_and_across_seconds(self):
+        """Test the cached time string is reused only within one second."""
+        stock = logging.Formatter(DEFAULT_LOG_FORMAT)
+        fast = FastFormatter()
+        for created in (1700000000.125, 1700000000.999, 1700000001.0, 1700000000.5):
+            assert fast.format(make_record(created=created)) == stock.format(
+                make_record(created=created)
+            )
+
+    def test_without_msec_format(self):
+        """Test a None default_msec_format leaves milliseconds off, as stock does."""
+        stock = logging.Formatter(DEFAULT_LOG_FORMAT)
+        stock.default_msec_format = None
+        fast = FastFormatter()
+        fast.default_msec_format = None
+        created = 1700000000.125
+        assert fast.format(make_record(created=created)) == stock.format(
+            make_record(created=created)
+        )
+
+    def test_record_with_exc_info(self):
+        """Test exception tracebacks are appended identically."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        self.assert_same(exc_info=exc_info)
+
+    def test_record_with_stack_info(self):
+        """Test stack info is appended identically."""
+        self.assert_same(sinfo="Stack (most recent call last):\n  frame")
+
+    def test_record_with_exc_and_stack_info(self):
+        """Test exception and stack info together format identically."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        self.assert_same(exc_info=exc_info, sinfo="Stack (most recent call last):\n  frame")
+
+    def test_message_ending_in_newline(self):
+        """Test no extra newline is added before a traceback."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        self.assert_same(msg="multi\nline\n", args=(), exc_info=exc_info)
+
+
+class TestBatchedRotatingFileHandler:
+    """Tests for the batching rotating file handler."""
+
+    def make_handler(self, path, max_bytes):
+        handler = _BatchedRotatingFileHandler(
+            filename=str(path), maxBytes=max_bytes, backupCount=3, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        return handler
+
+    def emit(self, handler, message):
+        handler.handle(
+            logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+        )
+
+    def test_rollover_at_max_bytes(self, tmp_path):
+        """Test the file rolls over once it would exceed max_bytes."""
+        log_path = tmp_path / "app.log"
+        handler = self.make_handler(log_path, 100)
+        try:
+            for i in range(10):
+                self.emit(handler, f"line {i:02d} " + "x" * 20)
+            handler.flush_batch()
+        finally:
+            handler.close()
+
+        assert Path(f"{log_path}.1").exists()
+        assert log_path.stat().st_size < 100
+        assert Path(f"{log_path}.1").stat().st_size < 100
+
+    def test_size_resynced_after_batch(self, tmp_path):
+        """Test multi-byte characters are counted in bytes after a flush."""
+        log_path = tmp_path / "app.log"
+        handler = self.make_handler(log_path, 1000)
+        try:
+            self.emit(handler, "é" * 50)
+            handler.flush_batch()
+
+            assert handler._size == log_path.stat().st_size == 101
+
+            # External truncation is picked up too
+            log_path.write_bytes(b"")
+            self.emit(handler, "abc")
+            handler.flush_batch()
+
+            assert handler._size == log_path.stat().st_size
+        finally:
+            handler.close()
+
+
+class TestQueuedLogging:
+    """Tests for queued, batched logging through setup_logging()."""
+
+    def test_records_written_when_queue_drains(self, tmp_path):
+        """Test records reach the file without stopping the listener."""
+        log_path = tmp_path / "app.log"
+        logger = setup_logging(LoggingConfig(file=str(log_path)))
+
+        logger.warning("drained record")
+
+        assert wait_for(lambda: "drained record" in log_path.read_text())
+
+    def test_stop_logging_flushes_buffered_records(self, tmp_path):
+        """Test stop_logging() writes out every queued record."""
+        log_path = tmp_path / "app.log"
+        logger = setup_logging(LoggingConfig(file=str(log_path)))
+
+        for i in range(500):
+            logger.info("record %d", i)
+        stop_logging()
+
+        contents = log_path.read_text()
+        assert "record 0\n" in contents
+        assert "record 499\n" in contents
+        assert contents.count(" - record ") == 500
+
+    def test_rotating_file_via_setup(self, tmp_path):
+        """Test rotation works end to end with batched writes."""
+        log_path = tmp_path / "app.log"
+        logger = setup_logging(
+            LoggingConfig(
+                file=str(log_path),
+                rotation=LogRotationConfig(max_bytes=2000, backup_count=2),
+            )
+        )
+
+        for i in range(100):
+            logger.info("rotating record %d", i)
+        stop_logging()
+
+        assert Path(f"{log_path}.1").exists()
+        assert log_path.stat().st_size < 2000
+
+
+class TestReconfiguration:
+    """Tests for calling setup_logging() again on a running configuration."""
+
+    def listener_handlers(self):
+        return list(logging_setup._queue_listener.handlers)
+
+    def test_same_file_updates_handlers_in_place(self, tmp_path):
+        """Test level and format changes keep the existing handlers."""
+        log_path = tmp_path / "app.log"
+        setup_logging(LoggingConfig(file=str(log_path)))
+        handlers = self.listener_handlers()
+
+        setup_logging(
+            LoggingConfig(
+                file=str(log_path), level="DEBUG", format="%(levelname)s %(message)s"
+            )
+        )
+
+        assert self.listener_handlers() == handlers
+        for handler in handlers:
+            assert handler.level == logging.DEBUG
+            assert not isinstance(handler.formatter, FastFormatter)
+            assert handler.formatter._fmt == "%(levelname)s %(message)s"
+        assert logging.getLogger().level == logging.DEBUG
+
+        logging.getLogger("mmdvm.test").debug("after reload")
+        stop_logging()
+        assert "DEBUG after reload\n" in log_path.read_text()
+
+    def test_changed_file_rebuilds_handlers(self, tmp_path):
+        """Test a new file path replaces and closes the old handlers."""
+        setup_logging(LoggingConfig(file=str(tmp_path / "first.log")))
+        old_handlers = self.listener_handlers()
+
+        setup_logging(LoggingConfig(file=str(tmp_path / "second.log")))
+        new_handlers = self.listener_handlers()
+
+        assert not set(map(id, old_handlers)) & set(map(id, new_handlers))
+        old_file_handler = old_handlers[-1]
+        assert old_file_handler.stream is None  # closed
+        assert new_handlers[-1].baseFilename == str(tmp_path / "second.log")
+
+    def test_changed_rotation_rebuilds_handlers(self, tmp_path):
+        """Test changed rotation settings replace and close the old handlers."""
+        log_path = tmp_path / "app.log"
+        setup_logging(LoggingConfig(file=str(log_path)))
+        old_handlers = self.listener_handlers()
+
+        setup_logging(
+            LoggingConfig(file=str(log_path), rotation=LogRotationConfig(max_bytes=2000))
+        )
+        new_handlers = self.listener_handlers()
+
+        assert not set(map(id, old_handlers)) & set(map(id, new_handlers))
+        assert old_handlers[-1].stream is None  # closed
+        assert new_handlers[-1].maxBytes == 2000
+
+
+class TestLoggerAdapter:
+    """Tests for the context-appending LoggerAdapter."""
+
+    def test_extra_appended(self, captured):
+        """Test the precomputed context suffix is appended to messages."""
+        logger, handler = captured
+        adapter = LoggerAdapter(logger, {"request_id": "12345", "mode": "DMR"})
+
+        adapter.info("Processing %s", "request")
+
+        assert handler.messages == ["Processing request [request_id=12345 mode=DMR]"]
+
+    @pytest.mark.parametrize("extra", [None, {}])
+    def test_no_extra_appends_nothing(self, captured, extra):
+        """Test messages are unchanged when there is no context."""
+        logger, handler = captured
+        LoggerAdapter(logger, extra).info("Processing request")
+
+        assert handler.messages == ["Processing request"]
+
+
+class TestLogHelpers:
+    """Tests for the security event and performance metric helpers."""
+
+    class Unformattable:
+        def __format__(self, spec):
+            raise AssertionError("message built for a disabled level")
+
+    def test_security_event(self, captured):
+        """Test security events carry the SECURITY prefix."""
+        logger, handler = captured
+        log_security_event(logger, "AUTH_FAILURE", "bad key", "ERROR")
+
+        assert handler.messages == ["SECURITY [AUTH_FAILURE]: bad key"]
+
+    def test_security_event_disabled(self, captured):
+        """Test nothing is emitted or formatted below the logger level."""
+        logger, handler = captured
+        logger.setLevel(logging.ERROR)
+
+        log_security_event(logger, "RATE_LIMIT", self.Unformattable())
+
+        assert handler.messages == []
+
+    def test_performance_metric(self, captured):
+        """Test metrics are logged at DEBUG with their unit."""
+        logger, handler = captured
+        logger.setLevel(logging.DEBUG)
+        log_performance_metric(logger, "qso_parse_time", 0.0023, "seconds")
+
+        assert handler.messages == ["METRIC [qso_parse_time]: 0.0023 seconds"]
+
+    def test_performance_metric_disabled(self, captured):
+        """Test nothing is emitted or formatted when DEBUG is disabled."""
+        logger, handler = captured
+
+        log_performance_metric(logger, "qso_parse_time", self.Unformattable())
+
+        assert handler.messages == []
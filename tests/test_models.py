@@ -1,23 +1,32 @@
 """
 Unit tests for data models.
 
-Tests Pydantic models for validation, serialization, and business logic.
+Tests models for validation, serialization, and business logic.
 """
 
+import dataclasses
+import json
+
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
+from mmdvm_state_machine import models
 from mmdvm_state_machine.models import (
     Mode,
     QSOStatus,
     QSO,
+    QSOIn,
     SystemState,
     ModemState,
     Event,
     HealthStatus,
     NetworkStatus,
     ModeStatus,
+    ModeValue,
+    ERROR_RING_SIZE,
+    serialize_events_json,
+    serialize_qsos_json,
 )
 
 
@@ -30,7 +39,7 @@ class TestQSOModel:
 
         assert qso.mode == Mode.DMR
         assert qso.status == QSOStatus.STARTING
-        assert isinstance(qso.id, UUID)
+        assert isinstance(qso.id, int)
         assert isinstance(qso.start_time, datetime)
         assert qso.end_time is None
         assert qso.duration_seconds is None
@@ -105,6 +114,37 @@ class TestQSOModel:
         qso.status = QSOStatus.TIMEOUT
         assert qso.is_active() is False
 
+    def test_qso_stores_plain_strings(self):
+        """Test enum arguments are stored as their plain string values."""
+        qso = QSO(mode=Mode.DMR, status=QSOStatus.ACTIVE)
+
+        assert type(qso.mode) is str
+        assert type(qso.status) is str
+        assert qso.mode == "DMR"
+
+    def test_qso_metadata_allocated_on_demand(self):
+        """Test metadata is only created when first used."""
+        qso = QSO(mode=Mode.DMR)
+
+        assert qso.metadata is None
+
+        qso.ensure_metadata()["color_code"] = 1
+
+        assert qso.metadata == {"color_code": 1}
+        assert qso.ensure_metadata() is qso.metadata
+
+    def test_qso_interns_callsigns(self):
+        """Test repeated callsigns share one string object."""
+        qso1 = QSO(mode=Mode.DMR, source_callsign="".join(["G4", "KLX"]))
+        qso2 = QSO(mode=Mode.DMR, source_callsign="".join(["G4K", "LX"]))
+
+        assert qso1.source_callsign is qso2.source_callsign
+
+    def test_qso_rejects_invalid_mode(self):
+        """Test unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            QSO(mode="AMPRNET")
+
     def test_qso_json_serialization(self):
         """Test QSO can be serialized to JSON."""
         qso = QSO(
@@ -113,13 +153,50 @@ class TestQSOModel:
             talk_group=235,
         )
 
-        json_dict = qso.model_dump()
+        json_dict = qso.to_dict()
 
         assert json_dict["mode"] == "DMR"
         assert json_dict["source_callsign"] == "G4KLX"
         assert json_dict["talk_group"] == 235
-        assert "id" in json_dict
+        assert UUID(json_dict["id"]).int == qso.id
         assert "start_time" in json_dict
+        assert "_mono_start" not in json_dict
+
+    def test_qso_id_is_uuid4(self):
+        """Test integer QSO IDs format as version 4 UUIDs."""
+        qso = QSO(mode=Mode.DMR)
+
+        assert UUID(json.loads(qso.to_json_bytes())["id"]).version == 4
+
+
+class TestQSOIn:
+    """Tests for the QSOIn ingress model."""
+
+    def test_qso_in_to_qso(self):
+        """Test validated input converts to an internal QSO."""
+        qso = QSOIn(mode="DMR", source_callsign="G4KLX", talk_group="235").to_qso()
+
+        assert isinstance(qso, QSO)
+        assert qso.mode == Mode.DMR
+        assert qso.status == QSOStatus.STARTING
+        assert qso.talk_group == 235
+        assert isinstance(qso.id, int)
+
+    def test_qso_from_json(self):
+        """Test QSO JSON round trip through the ingress model."""
+        qso = QSO(mode=Mode.DMR, source_callsign="G4KLX", talk_group=235)
+
+        parsed = QSO.from_json(qso.to_json_bytes())
+
+        assert parsed.mode == Mode.DMR
+        assert parsed.source_callsign == "G4KLX"
+        assert parsed.talk_group == 235
+        assert parsed.start_time == qso.start_time
+
+    def test_qso_in_rejects_invalid_mode(self):
+        """Test unknown modes are rejected at ingress."""
+        with pytest.raises(ValueError):
+            QSOIn(mode="AMPRNET")
 
 
 class TestSystemState:
@@ -144,7 +221,7 @@ class TestSystemState:
         state.add_active_qso(qso)
 
         assert len(state.active_qsos) == 1
-        assert state.active_qsos[0] == qso
+        assert next(iter(state.active_qsos.values())) == qso
 
     def test_remove_active_qso(self):
         """Test removing a QSO from active list."""
@@ -159,7 +236,7 @@ class TestSystemState:
 
         assert removed == qso1
         assert len(state.active_qsos) == 1
-        assert state.active_qsos[0] == qso2
+        assert next(iter(state.active_qsos.values())) == qso2
 
     def test_remove_nonexistent_qso(self):
         """Test removing a QSO that doesn't exist."""
@@ -171,7 +248,7 @@ class TestSystemState:
         # Try to remove non-existent QSO
         from uuid import uuid4
 
-        removed = state.remove_active_qso(uuid4())
+        removed = state.remove_active_qso(uuid4().int)
 
         assert removed is None
         assert len(state.active_qsos) == 1
@@ -205,6 +282,73 @@ class TestSystemState:
         assert state.error_count == 2
         assert state.last_error == "Second error"
 
+    def test_recent_errors_bounded(self):
+        """Test only the most recent errors are kept."""
+        state = SystemState()
+
+        for i in range(ERROR_RING_SIZE + 5):
+            state.record_error(f"error {i}")
+
+        errors = state.recent_errors()
+
+        assert len(errors) == ERROR_RING_SIZE
+        assert errors[0][1] == "error 5"
+        assert errors[-1][1] == f"error {ERROR_RING_SIZE + 4}"
+        assert isinstance(errors[-1][0], datetime)
+        assert errors[0][0] <= errors[-1][0]
+        assert state.error_count == ERROR_RING_SIZE + 5
+
+    def test_snapshot_updates_last_update(self):
+        """Test snapshot() stamps last_update only after a change."""
+        state = SystemState(last_update=datetime(2024, 1, 1))
+
+        assert state.snapshot()["last_update"] == datetime(2024, 1, 1)
+
+        state.add_active_qso(QSO(mode=Mode.DMR))
+        assert state.last_update == datetime(2024, 1, 1)
+
+        data = state.snapshot()
+
+        assert data["last_update"] > datetime(2024, 1, 1)
+        assert len(data["active_qsos"]) == 1
+
+    def test_mode_status(self):
+        """Test setting and retrieving per-mode status."""
+        state = SystemState()
+
+        assert state.get_mode_status(Mode.DMR) is None
+
+        state.set_mode_status(ModeStatus(mode=Mode.DMR, network_name="BM_2341"))
+
+        assert state.get_mode_status(Mode.DMR).network_name == "BM_2341"
+        assert state.get_mode_status(Mode.YSF) is None
+        assert list(state.to_dict()["mode_status"]) == ["DMR"]
+
+    def test_update_mode_status(self):
+        """Test mode status updates replace the immutable status."""
+        state = SystemState()
+        first = state.update_mode_status(Mode.DMR, network_name="BM_2341")
+
+        second = state.update_mode_status(Mode.DMR, network_status=NetworkStatus.CONNECTED)
+
+        assert first.network_status == "UNKNOWN"
+        assert second.network_status == "CONNECTED"
+        assert second.network_name == "BM_2341"
+        assert state.get_mode_status(Mode.DMR) is second
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            second.enabled = False
+
+    def test_system_state_serialization(self):
+        """Test active QSOs serialize as a list."""
+        state = SystemState()
+        qso = QSO(mode=Mode.DMR, source_callsign="G4KLX")
+        state.add_active_qso(qso)
+
+        json_dict = state.to_dict()
+
+        assert isinstance(json_dict["active_qsos"], list)
+        assert json_dict["active_qsos"][0]["source_callsign"] == "G4KLX"
+
 
 class TestEvent:
     """Tests for Event model."""
@@ -230,13 +374,30 @@ class TestEvent:
             data={"old_mode": "IDLE", "new_mode": "DMR"},
         )
 
-        json_dict = event.model_dump()
+        json_dict = event.to_dict()
 
         assert json_dict["event_type"] == "mode_changed"
         assert "event_id" in json_dict
         assert "timestamp" in json_dict
         assert "data" in json_dict
 
+    def test_event_json_bytes(self):
+        """Test event serializes straight to JSON bytes."""
+        event = Event(event_type="mode_changed", data={"new_mode": "DMR"})
+
+        payload = json.loads(event.to_json_bytes())
+
+        assert payload["event_type"] == "mode_changed"
+        assert payload["event_id"] == str(event.event_id)
+        assert payload["data"] == {"new_mode": "DMR"}
+
+    def test_event_immutable(self):
+        """Test events cannot be modified once created."""
+        event = Event(event_type="mode_changed")
+
+        with pytest.raises(AttributeError):
+            event.severity = "error"
+
 
 class TestHealthStatus:
     """Tests for HealthStatus model."""
@@ -276,6 +437,7 @@ class TestHealthStatus:
         assert health.healthy is False
         assert health.error_count == 5
         assert health.last_error == "Log monitor crashed"
+        assert isinstance(health.current_time, datetime)
 
 
 class TestEnums:
@@ -292,6 +454,13 @@ class TestEnums:
         assert Mode.FM.value == "FM"
         assert Mode.IDLE.value == "IDLE"
 
+    def test_mode_values_match_enum(self):
+        """Test the plain-string mode constants match the Mode enum."""
+        constants = {k: v for k, v in vars(ModeValue).items() if not k.startswith("_")}
+
+        assert constants == {m.name: m.value for m in Mode}
+        assert all(type(v) is str for v in constants.values())
+
     def test_qso_status_enum_values(self):
         """Test QSOStatus enum has expected values."""
         assert QSOStatus.STARTING.value == "STARTING"
@@ -308,3 +477,53 @@ class TestEnums:
         assert ModemState.TX.value == "TX"
         assert ModemState.ERROR.value == "ERROR"
         assert ModemState.UNKNOWN.value == "UNKNOWN"
+
+
+class TestSerializers:
+    """Tests for the list serializers."""
+
+    def test_serialize_qsos_json(self):
+        """Test QSOs serialize to a JSON array."""
+        qsos = [QSO(mode=Mode.DMR), QSO(mode=Mode.YSF, source_callsign="M0ABC")]
+
+        payload = json.loads(serialize_qsos_json(qsos))
+
+        assert [item["mode"] for item in payload] == ["DMR", "YSF"]
+        assert payload[1]["source_callsign"] == "M0ABC"
+        assert "_mono_start" not in payload[0]
+
+    def test_serialize_events_json(self):
+        """Test events serialize to a JSON array of objects."""
+        event = Event(event_type="mode_changed", data={"new_mode": "DMR"})
+
+        payload = json.loads(serialize_events_json([event]))
+
+        assert payload[0]["event_type"] == "mode_changed"
+        assert payload[0]["event_id"] == str(event.event_id)
+
+    def test_json_matches_without_orjson(self, monkeypatch):
+        """Test the pydantic-core fallback gives the same JSON as orjson."""
+        qso = QSO(
+            mode=Mode.DMR,
+            source_callsign="G4KLX",
+            end_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        qso.ensure_metadata()["color_code"] = 1
+        parsed = QSO.from_json(b'{"mode":"DMR","start_time":"2024-01-01T00:00:00Z"}')
+        event = Event(event_type="qso_started", data={"mode": "DMR", "at": parsed.start_time})
+        outputs = [
+            qso.to_json_bytes(),
+            event.to_json_bytes(),
+            serialize_qsos_json([qso, parsed]),
+            serialize_events_json([event]),
+        ]
+
+        monkeypatch.setattr(models, "orjson", None)
+        fallback = [
+            qso.to_json_bytes(),
+            event.to_json_bytes(),
+            serialize_qsos_json([qso, parsed]),
+            serialize_events_json([event]),
+        ]
+
+        assert [json.loads(o) for o in outputs] == [json.loads(o) for o in fallback]